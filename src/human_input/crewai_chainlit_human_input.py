@@ -1,9 +1,10 @@
 import asyncio
 import os
 from pathlib import Path
+from typing import Optional
 
 import chainlit as cl
-from chainlit import run_sync
+import requests
 from crewai import LLM, Agent, Crew, Task
 from crewai.tools import BaseTool
 from dotenv import load_dotenv
@@ -41,8 +42,23 @@ class PersonalInformationOutput(BaseModel):
     city: str = Field(default="UNKNOWN", description="Person's city of residence")
 
 
+# Ollama embedder used for crew memory
+OLLAMA_EMBEDDER = os.getenv("OLLAMA_EMBEDDER", "mxbai-embed-large")
+OLLAMA_EMBEDDINGS_URL = "http://localhost:11434/api/embeddings"  # Default Ollama URL
+
+# Event loop serving the Chainlit app. Captured when a chat starts so tools
+# running in crew worker threads can schedule UI calls on it directly.
+app_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+background_tasks: set = set()
+
+
 def ask_human(question: str) -> str:
-    human_response = run_sync(cl.AskUserMessage(content=f"{question}").send())
+    future = asyncio.run_coroutine_threadsafe(
+        cl.AskUserMessage(content=question).send(), app_loop
+    )
+    human_response = future.result()
     if human_response:
         return human_response["output"]
 
@@ -131,7 +147,6 @@ llm = LLM(
     frequency_penalty=0.0,
     presence_penalty=0.0,
     stop=None,
-    timeout=10,
     stream=True,
 )
 
@@ -143,26 +158,47 @@ my_crew = Crew(
     embedder={
         "provider": "ollama",
         "config": {
-            "model": os.getenv(
-                "OLLAMA_EMBEDDER", "mxbai-embed-large"
-            ),  # or "nomic-embed-text"
-            "url": "http://localhost:11434/api/embeddings",  # Default Ollama URL
+            "model": OLLAMA_EMBEDDER,  # or "nomic-embed-text"
+            "url": OLLAMA_EMBEDDINGS_URL,
         },
     },
     llm=llm,
 )
 
+_kickoff = my_crew.kickoff
+
+
+def warm_up_embedder() -> None:
+    """Load the embedding model in Ollama so the first memory lookup is not a cold start."""
+    try:
+        response = requests.post(
+            OLLAMA_EMBEDDINGS_URL,
+            json={"model": OLLAMA_EMBEDDER, "prompt": "warmup"},
+            timeout=60,
+        )
+        response.raise_for_status()
+        logger.print_debug(f"Embedder {OLLAMA_EMBEDDER} warmed up")
+    except requests.RequestException as e:
+        logger.warning(f"Embedder warm-up failed: {str(e)}")
+
+
 if __name__ == "__main__":
-    input_data = CrewInput(initial_message="Hi I am James")
-    logger.print_input(input_data.model_dump())
+    inputs = CrewInput(initial_message="Hi I am James").model_dump()
+    logger.print_input(inputs)
     logger.print_crew_status("Starting crew execution...", "info")
-    result = my_crew.kickoff(inputs=input_data.model_dump())
+    result = _kickoff(inputs=inputs)
     logger.print_output(result)
 
 
 @cl.on_chat_start
 async def on_chat_start():
+    global app_loop
+    app_loop = asyncio.get_running_loop()
     logger.print_info("Chat session started")
+    # Warm the embedder in the background while the user reads the greeting
+    task = asyncio.create_task(asyncio.to_thread(warm_up_embedder))
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
     await cl.Message(
         content="Hello I am your personal Assistant. How can I help?"
     ).send()
@@ -170,15 +206,15 @@ async def on_chat_start():
 
 @cl.on_message
 async def on_message(message: cl.Message):
-    # This function will be called when user sends their first and subsequent messages
-    input_data = CrewInput(initial_message=message.content)
-    logger.print_input(input_data.model_dump())
+    # This function will be called when user sends their first and subsequent messages.
+    # The input is a plain dict in the shape of CrewInput; message content is
+    # always a string so there is nothing for pydantic to validate.
+    inputs = {"initial_message": message.content}
+    logger.print_input(inputs)
     logger.print_crew_status("Processing user message...", "info")
 
     try:
-        result = await asyncio.to_thread(
-            lambda: my_crew.kickoff(inputs=input_data.model_dump())
-        )
+        result = await asyncio.to_thread(_kickoff, inputs=inputs)
         logger.print_output(result)
         await cl.Message(content=str(result)).send()
     except Exception as e:
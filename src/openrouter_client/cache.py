@@ -0,0 +1,127 @@
+import contextlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "openrouter"
+)
+DEFAULT_CACHE_TTL = 3600
+
+
+class CacheEntry(NamedTuple):
+    """A cached payload and the validators needed to revalidate it."""
+
+    payload: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ModelCache:
+    """
+    On-disk cache for the raw OpenRouter models payload.
+
+    The response body is stored verbatim after a one-line JSON header holding
+    the ETag and Last-Modified validators, so a new process can either reuse
+    the payload while it is within the TTL or revalidate it with a conditional
+    request. Keeping both in one file means a single atomic replace updates
+    them together, even when several processes refresh the cache at once.
+    """
+
+    CACHE_FILE = "models.cache"
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: int = DEFAULT_CACHE_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the cache files. Defaults to ~/.cache/openrouter.
+            ttl: Number of seconds a cached payload is used without revalidation.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.path = self.cache_dir / self.CACHE_FILE
+
+    def is_fresh(self) -> bool:
+        """Return True if a cached payload exists and is younger than the TTL."""
+        try:
+            age = time.time() - self.path.stat().st_mtime
+        except OSError:
+            return False
+        return age < self.ttl
+
+    def load(self) -> Optional[CacheEntry]:
+        """
+        Load the cached payload.
+
+        Returns:
+            The cache entry, or None if nothing is cached.
+        """
+        try:
+            data = self.path.read_bytes()
+        except OSError:
+            return None
+
+        header, _, payload = data.partition(b"\n")
+        try:
+            meta = json.loads(header)
+        except ValueError:
+            return None
+        if not isinstance(meta, dict):
+            return None
+
+        return CacheEntry(payload, meta.get("etag"), meta.get("last_modified"))
+
+    def save(
+        self,
+        payload: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Store a payload and its validators.
+
+        Args:
+            payload: Raw response body.
+            etag: ETag header returned with the payload, if any.
+            last_modified: Last-Modified header returned with the payload, if any.
+        """
+        # json.dumps escapes newlines, so the header is always a single line
+        header = json.dumps({"etag": etag, "last_modified": last_modified})
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(header.encode() + b"\n" + payload)
+
+    def touch(self) -> None:
+        """Mark the cached payload as freshly validated."""
+        with contextlib.suppress(OSError):
+            os.utime(self.path)
+
+    def clear(self) -> None:
+        """Remove the cached payload and its validators."""
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+    def _write_atomic(self, data: bytes) -> None:
+        """
+        Write data to the cache file via a uniquely named temporary file.
+
+        Concurrent writers each get their own temporary file, and readers only
+        ever see a complete file thanks to the final atomic replace.
+
+        Args:
+            data: Complete cache file contents.
+        """
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.cache_dir, prefix=f".{self.CACHE_FILE}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
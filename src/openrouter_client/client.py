@@ -1,12 +1,20 @@
 import os
-from typing import Dict, List, Optional
+from collections import Counter
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 
 import requests
 
-from src.utils.logging import UnifiedLogger
+from src.utils.logging import LoguruAdapter, UnifiedLogger, get_default_logger
 
+from .cache import DEFAULT_CACHE_TTL, ModelCache
+from .index import ModelIndex
 from .models import ModelListResponse, ModelMetadata, ModelRequirements
 
+ModelPredicate = Tuple[str, Callable[[ModelMetadata], bool]]
+
 
 class OpenRouterClient:
     """
@@ -16,17 +24,32 @@ class OpenRouterClient:
 
     BASE_URL = "https://openrouter.ai/api/v1"
     MODELS_ENDPOINT = "/models"
-
-    def __init__(self, logger: UnifiedLogger, api_key: str = None):
+    REQUEST_TIMEOUT = 30
+    READ_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        logger: Optional[Union[UnifiedLogger, LoguruAdapter]] = None,
+        api_key: str = None,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: int = DEFAULT_CACHE_TTL,
+    ):
         """
         Initialize the OpenRouter client.
 
         Args:
-            logger: UnifiedLogger instance for logging.
+            logger: UnifiedLogger instance for logging. Defaults to the shared
+                    silent logger from get_default_logger(); pass a
+                    LoguruAdapter with a level to forward records to loguru
+                    without changing the logging setup.
             api_key: OpenRouter API key. If not provided, will attempt to read from
                     OPENROUTER_API_KEY environment variable.
+            cache_dir: Directory for the on-disk models cache. Defaults to
+                    ~/.cache/openrouter.
+            cache_ttl: Seconds a cached models list is reused without contacting
+                    the API.
         """
-        self.logger = logger
+        self.logger = logger or get_default_logger()
         self.api_key = api_key or os.environ.get("OPENROUTER_API_KEY")
         if not self.api_key:
             self.logger.print_error(
@@ -37,26 +60,29 @@ class OpenRouterClient:
             )
 
         self._models_cache: Optional[List[ModelMetadata]] = None
+        self._index: Optional[ModelIndex] = None
+        self._disk_cache = ModelCache(cache_dir, cache_ttl)
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+        )
         self.logger.print_debug("OpenRouter client initialized")
 
-    def _get_headers(self) -> Dict[str, str]:
-        """
-        Get the headers required for API requests.
-
-        Returns:
-            Dictionary of headers including authorization.
-        """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
     def fetch_models(self, force_refresh: bool = False) -> List[ModelMetadata]:
         """
         Fetch available models from OpenRouter.
 
+        Models are cached in memory and on disk. A cached payload younger than the
+        cache TTL is used without contacting the API; otherwise the request is
+        sent with the cached ETag/Last-Modified validators so an unchanged list
+        costs a 304 response. force_refresh skips the TTL but still revalidates.
+
         Args:
-            force_refresh: If True, bypass cache and fetch fresh data.
+            force_refresh: If True, ignore the cache TTL and revalidate the cached
+                    list with the API, reusing it if unchanged.
 
         Returns:
             List of model metadata objects.
@@ -69,16 +95,57 @@ class OpenRouterClient:
             self.logger.debug("Returning cached models")
             return self._models_cache
 
+        cached = self._disk_cache.load()
+        if cached is not None and not force_refresh and self._disk_cache.is_fresh():
+            try:
+                self._models_cache = self._parse_models(cached.payload)
+                self.logger.print_debug(
+                    f"Loaded {len(self._models_cache)} models from {self._disk_cache.path}"
+                )
+                return self._models_cache
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable models cache: {e}")
+                cached = None
+
         url = f"{self.BASE_URL}{self.MODELS_ENDPOINT}"
         self.logger.print_debug(f"Fetching models from {url}")
 
-        try:
-            response = requests.get(url, headers=self._get_headers())
-            response.raise_for_status()
+        # Authorization is set on the session; only revalidation headers vary
+        conditional_headers = {}
+        if cached is not None:
+            if cached.etag:
+                conditional_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                conditional_headers["If-Modified-Since"] = cached.last_modified
 
-            # Parse the response using Pydantic model
-            model_list = ModelListResponse.model_validate(response.json())
-            self._models_cache = model_list.data
+        try:
+            # Stream the body so 304 and error responses are closed without
+            # being downloaded, and the catalog is read in large chunks.
+            response = self._session.get(
+                url,
+                headers=conditional_headers or None,
+                timeout=self.REQUEST_TIMEOUT,
+                stream=True,
+            )
+            try:
+                if response.status_code == 304 and cached is not None:
+                    self.logger.print_debug("Models unchanged, reusing cached payload")
+                    self._disk_cache.touch()
+                    if self._models_cache is None:
+                        self._models_cache = self._parse_models(cached.payload)
+                    return self._models_cache
+
+                response.raise_for_status()
+                payload = b"".join(response.iter_content(self.READ_CHUNK_SIZE))
+            finally:
+                response.close()
+
+            self._models_cache = self._parse_models(payload)
+            self._save_to_disk(
+                payload,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
             self.logger.print_debug(
                 f"Successfully fetched {len(self._models_cache)} models"
             )
@@ -93,9 +160,49 @@ class OpenRouterClient:
             self.logger.print_error(error_msg)
             raise ValueError(error_msg)
 
+    def _parse_models(self, payload: bytes) -> List[ModelMetadata]:
+        """
+        Parse a raw /models response body.
+
+        Args:
+            payload: Raw JSON response body.
+
+        Returns:
+            List of model metadata objects.
+        """
+        # The wrapper model's validator is built once at import and validates the
+        # raw bytes, including every entry of "data", in a single pydantic-core
+        # pass, with no Python-level json.loads to unwrap "data" first.
+        return ModelListResponse.model_validate_json(payload).data
+
+    def _save_to_disk(
+        self,
+        payload: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        """
+        Persist a models payload to the disk cache, logging rather than failing.
+
+        Args:
+            payload: Raw JSON response body.
+            etag: ETag header returned with the payload, if any.
+            last_modified: Last-Modified header returned with the payload, if any.
+        """
+        try:
+            self._disk_cache.save(payload, etag, last_modified)
+        except OSError as e:
+            self.logger.warning(f"Could not write models cache: {e}")
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
     def clear_cache(self) -> None:
-        """Clear the models cache."""
+        """Clear the in-memory and on-disk models cache."""
         self._models_cache = None
+        self._index = None
+        self._disk_cache.clear()
         self.logger.print_info("Model cache cleared")
 
     def select_model(self, requirements: ModelRequirements) -> Optional[ModelMetadata]:
@@ -109,158 +216,178 @@ class OpenRouterClient:
             The best matching model, or None if no model meets the requirements.
         """
         self.logger.print_info("Selecting model based on requirements")
-        self.logger.print_json(requirements.model_dump(), "Model Requirements")
+        self.logger.print_json(
+            requirements.model_dump(mode="json"), "Model Requirements"
+        )
 
         models = self.fetch_models(force_refresh=requirements.force_refresh)
 
-        # Filter models based on requirements
-        filtered_models = self._filter_models(models, requirements)
+        # Matches come out cheapest first, so the best match is the first one
+        # and the rest of the catalog is never checked
+        with closing(self._iter_matching(models, requirements)) as matching_models:
+            selected_model = next(matching_models, None)
 
         # If no models meet the requirements, return None
-        if not filtered_models:
+        if selected_model is None:
             self.logger.print_warning("No models found matching the requirements")
             return None
 
-        # Sort models by cost (lowest first) as a default priority
-        sorted_models = sorted(
-            filtered_models,
-            key=lambda m: float(m.pricing.prompt) + float(m.pricing.completion),
+        self.logger.print_debug(
+            f"Selected model: {selected_model.name} (ID: {selected_model.id})"
         )
-
-        # Return the best match (lowest cost model that meets all requirements)
-        selected_model = sorted_models[0] if sorted_models else None
-        if selected_model:
-            self.logger.print_debug(
-                f"Selected model: {selected_model.name} (ID: {selected_model.id})"
-            )
         return selected_model
 
-    def _filter_models(
+    def _iter_matching(
         self, models: List[ModelMetadata], requirements: ModelRequirements
-    ) -> List[ModelMetadata]:
+    ) -> Iterator[ModelMetadata]:
         """
-        Filter models based on the specified requirements.
+        Lazily yield the models that meet the specified requirements.
 
         Args:
-            models: List of models to filter.
+            models: Models to filter.
             requirements: Requirements for filtering.
 
-        Returns:
-            List of models that meet the requirements.
+        Yields:
+            Models that meet the requirements, cheapest first.
         """
-        filtered_models = []
+        index = self._index_for(models)
+        predicates = self._compile_predicates(requirements)
+        rejections: Counter = Counter()
 
-        for model in models:
-            # Check if model meets all requirements
-            if self._model_meets_requirements(model, requirements):
-                filtered_models.append(model)
+        # The index is sorted by cost, so the cost requirement is a cutoff
+        # rather than a per-model check
+        candidates = len(index)
+        if requirements.max_cost_per_token is not None:
+            candidates = index.cost_cutoff(requirements.max_cost_per_token * 2)
+            rejections["cost"] = len(index) - candidates
 
-        self.logger.print_debug(
-            f"Found {len(filtered_models)} models matching requirements"
-        )
-        return filtered_models
+        checked = matched = 0
+        try:
+            for model in islice(index.models, candidates):
+                checked += 1
+                if self._model_meets_requirements(model, predicates, rejections):
+                    matched += 1
+                    yield model
+        finally:
+            # Summarize once instead of logging every rejected model, and only
+            # build the summary when debug output is on. This also runs when
+            # the caller stops early and closes the generator.
+            if self.logger.debug_mode:
+                self.logger.print_debug(
+                    f"Checked {checked}/{len(index)} models, {matched} matched; "
+                    f"rejections: {dict(rejections)}"
+                )
 
-    def _model_meets_requirements(
-        self, model: ModelMetadata, requirements: ModelRequirements
-    ) -> bool:
+    def _index_for(self, models: List[ModelMetadata]) -> ModelIndex:
         """
-        Check if a model meets the specified requirements.
+        Return the cost index for a model list, building it when the list changes.
 
         Args:
-            model: Model to check.
-            requirements: Requirements to check against.
+            models: Model catalog, normally the list returned by fetch_models.
 
         Returns:
-            True if the model meets all requirements, False otherwise.
+            Index over the given list.
         """
-        # Check if model is in exclude list
-        if requirements.exclude_models and model.id in requirements.exclude_models:
-            self.logger.debug(f"Model {model.name} excluded by requirements")
-            return False
+        if self._index is None or self._index.source is not models:
+            self._index = ModelIndex(models)
+        return self._index
 
-        # Check cost requirements
-        if requirements.max_cost_per_token is not None:
-            self.logger.debug(
-                f"Checking cost at most {requirements.max_cost_per_token} for {model.name}"
-            )
-            prompt_cost = float(model.pricing.prompt)
-            completion_cost = float(model.pricing.completion)
-            avg_cost = (prompt_cost + completion_cost) / 2
+    def _compile_predicates(
+        self, requirements: ModelRequirements
+    ) -> List[ModelPredicate]:
+        """
+        Build the checks for the requirements that are actually set.
 
-            if avg_cost > requirements.max_cost_per_token:
-                self.logger.debug(f"Model {model.name} exceeds cost requirements")
-                return False
+        Thresholds and sets are captured once here, so filtering a catalog only
+        runs the active checks instead of re-inspecting every requirement field
+        for every model. The cost limit is not among them: it is applied as a
+        cutoff on the ModelIndex.
+
+        Args:
+            requirements: Requirements to compile.
+
+        Returns:
+            List of (reason, predicate) pairs. A predicate returns False when a
+            model fails the check named by reason.
+        """
+        predicates: List[ModelPredicate] = []
+
+        # Check if model is in exclude list
+        if requirements.exclude_models:
+            exclude_models = requirements.exclude_models
+            predicates.append(("excluded", lambda m: m.id not in exclude_models))
 
         # Check context length requirements
         if requirements.min_context_length is not None:
-            self.logger.debug(
-                f"Checking context length at least {requirements.min_context_length} for {model.name}"
+            min_context_length = requirements.min_context_length
+            predicates.append(
+                ("context_length", lambda m: m.context_length >= min_context_length)
             )
-            if model.context_length < requirements.min_context_length:
-                self.logger.debug(
-                    f"Model {model.name} does not meet context length requirements"
-                )
-                return False
 
         # Check required features/parameters
         if requirements.required_features:
-            self.logger.debug(
-                f"Checking required features {requirements.required_features} for {model.name}"
+            required_features = requirements.required_features
+            predicates.append(
+                ("features", lambda m: required_features <= m.supported_parameter_set)
             )
-            if not all(
-                feature in model.supported_parameters
-                for feature in requirements.required_features
-            ):
-                self.logger.debug(
-                    f"Model {model.name} does not support all required features"
-                )
-                return False
 
         # Check input modalities
         if requirements.input_modalities:
-            self.logger.debug(
-                f"Checking input modalities {requirements.input_modalities} for {model.name}"
-            )
-            if not all(
-                modality in model.architecture.input_modalities
-                for modality in requirements.input_modalities
-            ):
-                self.logger.debug(
-                    f"Model {model.name} does not support all required input modalities"
+            input_modalities = requirements.input_modalities
+            predicates.append(
+                (
+                    "input_modalities",
+                    lambda m: input_modalities <= m.architecture.input_modality_set,
                 )
-                return False
+            )
 
         # Check output modalities
         if requirements.output_modalities:
-            self.logger.debug(
-                f"Checking output modalities {requirements.output_modalities} for {model.name}"
-            )
-            if not all(
-                modality in model.architecture.output_modalities
-                for modality in requirements.output_modalities
-            ):
-                self.logger.debug(
-                    f"Model {model.name} does not support all required output modalities"
+            output_modalities = requirements.output_modalities
+            predicates.append(
+                (
+                    "output_modalities",
+                    lambda m: output_modalities <= m.architecture.output_modality_set,
                 )
-                return False
+            )
 
         # Check moderation preference
-        if requirements.prefer_unmoderated is not None:
-            self.logger.debug(
-                f"Checking moderation preference {requirements.prefer_unmoderated} for {model.name}"
-            )
-            if requirements.prefer_unmoderated and model.top_provider.is_moderated:
-                self.logger.debug(
-                    f"Model {model.name} does not meet moderation requirements"
-                )
+        if requirements.prefer_unmoderated:
+            predicates.append(("moderation", lambda m: not m.top_provider.is_moderated))
+
+        return predicates
+
+    def _model_meets_requirements(
+        self,
+        model: ModelMetadata,
+        predicates: List[ModelPredicate],
+        rejections: Optional[Counter] = None,
+    ) -> bool:
+        """
+        Check if a model passes all compiled requirement predicates.
+
+        Args:
+            model: Model to check.
+            predicates: Predicates built by _compile_predicates.
+            rejections: Optional counter tallying the reason a model was rejected.
+
+        Returns:
+            True if the model meets all requirements, False otherwise.
+        """
+        for reason, predicate in predicates:
+            if not predicate(model):
+                if rejections is not None:
+                    rejections[reason] += 1
                 return False
 
         # If we've passed all checks, the model meets the requirements
-        self.logger.debug(f"Model {model.name} meets all requirements")
         return True
 
     def select_models(
-        self, requirements: ModelRequirements, limit: int = 5
+        self,
+        requirements: ModelRequirements,
+        limit: int = 5,
+        models: Optional[List[ModelMetadata]] = None,
     ) -> List[ModelMetadata]:
         """
         Select multiple models that meet the specified requirements.
@@ -268,30 +395,29 @@ class OpenRouterClient:
         Args:
             requirements: Requirements for model selection.
             limit: Maximum number of models to return.
+            models: Catalog to select from, e.g. one already fetched with
+                    fetch_models. Fetched here when not given.
 
         Returns:
             List of models that meet the requirements, sorted by cost.
         """
         self.logger.print_debug(f"Selecting up to {limit} models based on requirements")
-        self.logger.print_debug_json(requirements.model_dump(), "Model Requirements")
-
-        models = self.fetch_models()
+        if self.logger.debug_mode:
+            self.logger.print_debug_json(
+                requirements.model_dump(mode="json"), "Model Requirements"
+            )
 
-        # Filter models based on requirements
-        filtered_models = self._filter_models(models, requirements)
+        if models is None:
+            models = self.fetch_models(force_refresh=requirements.force_refresh)
 
-        # Sort models by cost (lowest first)
-        sorted_models = sorted(
-            filtered_models,
-            key=lambda m: float(m.pricing.prompt) + float(m.pricing.completion),
-        )
-
-        # Return up to the specified limit
-        if limit > 0:
-            selected_models = sorted_models[:limit]
-        else:
-            selected_models = sorted_models
+        # Filter models based on requirements and return up to the specified
+        # limit. Matches come out cheapest first, so filtering stops once the
+        # limit is reached and no sorting is needed.
+        with closing(self._iter_matching(models, requirements)) as matching_models:
+            if limit > 0:
+                selected_models = list(islice(matching_models, limit))
+            else:
+                selected_models = list(matching_models)
 
         self.logger.print_debug(f"Selected {len(selected_models)} models")
         return selected_models
-        return selected_models
@@ -0,0 +1,45 @@
+from bisect import bisect_right
+from typing import List
+
+from .models import ModelMetadata
+
+
+class ModelIndex:
+    """
+    Model catalog ordered by total cost, with the costs held in a parallel list.
+
+    Because the costs are sorted, a maximum-cost requirement becomes a single
+    binary search instead of a per-model comparison, and matches come out
+    cheapest first.
+    """
+
+    def __init__(self, models: List[ModelMetadata]):
+        """
+        Build the index.
+
+        Args:
+            models: Catalog to index. Kept by reference so callers can tell
+                    whether an index was built from a given list.
+        """
+        self.source = models
+        # Read each cost once, then order positions by the plain float list;
+        # the sort key is a list lookup rather than an attribute access
+        costs = [model.total_cost for model in models]
+        order = sorted(range(len(models)), key=costs.__getitem__)
+        self.models = [models[i] for i in order]
+        self.total_costs = [costs[i] for i in order]
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def cost_cutoff(self, max_total_cost: float) -> int:
+        """
+        Count the leading models whose total cost is within a limit.
+
+        Args:
+            max_total_cost: Maximum combined prompt and completion cost.
+
+        Returns:
+            Number of models, from the start of self.models, within the limit.
+        """
+        return bisect_right(self.total_costs, max_total_cost)
@@ -1,31 +1,77 @@
-from typing import Any, Dict, List, Optional
+from functools import cached_property, lru_cache
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Self, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
-class Architecture(BaseModel):
+@lru_cache(maxsize=None)
+def _cached_property_names(cls: type) -> Tuple[str, ...]:
+    """Names of the cached_property attributes defined on a class or its bases."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, cached_property)
+    )
+
+
+class _DerivedValuesModel(BaseModel):
+    """
+    Frozen model whose cached_property values are derived from its fields.
+
+    cached_property stores its value in the instance __dict__, which
+    model_copy copies along with the fields. Copies made with an update
+    therefore drop those values so they are derived again from the new fields.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        """Copy the model, dropping derived values if any field is updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _cached_property_names(type(self)):
+                copied.__dict__.pop(name, None)
+        return copied
+
+
+class Architecture(_DerivedValuesModel):
     """Model architecture information."""
 
-    input_modalities: List[str] = Field(
-        default_factory=list,
+    input_modalities: Tuple[str, ...] = Field(
+        default=(),
         description="Input modalities supported by the model (e.g., text, image)",
     )
-    output_modalities: List[str] = Field(
-        default_factory=list,
+    output_modalities: Tuple[str, ...] = Field(
+        default=(),
         description="Output modalities supported by the model (e.g., text)",
     )
     tokenizer: Optional[str] = Field(
         None, description="Tokenizer type used by the model"
     )
 
+    @cached_property
+    def input_modality_set(self) -> FrozenSet[str]:
+        """Input modalities as a frozenset."""
+        return frozenset(self.input_modalities)
+
+    @cached_property
+    def output_modality_set(self) -> FrozenSet[str]:
+        """Output modalities as a frozenset."""
+        return frozenset(self.output_modalities)
+
 
 class TopProvider(BaseModel):
     """Information about the top provider for this model."""
 
+    model_config = ConfigDict(frozen=True)
+
     is_moderated: bool = Field(False, description="Whether the provider is moderated")
 
 
-class Pricing(BaseModel):
+class Pricing(_DerivedValuesModel):
     """Pricing information for the model."""
 
     prompt: str = Field(..., description="Cost per token for prompt")
@@ -37,15 +83,34 @@ class Pricing(BaseModel):
     web_search: str = Field("0", description="Cost for web search")
     internal_reasoning: str = Field("0", description="Cost for internal reasoning")
 
+    @cached_property
+    def prompt_cost(self) -> float:
+        """Cost per prompt token as a float."""
+        return float(self.prompt)
+
+    @cached_property
+    def completion_cost(self) -> float:
+        """Cost per completion token as a float."""
+        return float(self.completion)
+
+    @model_validator(mode="after")
+    def _parse_costs(self) -> "Pricing":
+        """Convert the token costs during validation so bad values fail at load time."""
+        # Reading the cached properties stores the parsed floats on the instance
+        _ = (self.prompt_cost, self.completion_cost)
+        return self
+
 
 class PerRequestLimits(BaseModel):
     """Per-request limits for the model."""
 
+    model_config = ConfigDict(frozen=True)
+
     key: Optional[str] = Field(None, description="Limit key")
     value: Optional[Any] = Field(None, description="Limit value")
 
 
-class ModelMetadata(BaseModel):
+class ModelMetadata(_DerivedValuesModel):
     """Metadata for an OpenRouter AI model."""
 
     id: str = Field(..., description="Unique identifier for the model")
@@ -66,10 +131,29 @@ class ModelMetadata(BaseModel):
     per_request_limits: Optional[Dict[str, Any]] = Field(
         None, description="Per-request limits"
     )
-    supported_parameters: List[str] = Field(
-        default_factory=list, description="Parameters supported by the model"
+    supported_parameters: Tuple[str, ...] = Field(
+        default=(), description="Parameters supported by the model"
     )
 
+    # Derived values below are computed on first use and stored in the instance
+    # __dict__, so later reads are plain attribute lookups. The model is frozen
+    # and model_copy drops them when fields are updated, so they never go stale.
+
+    @cached_property
+    def total_cost(self) -> float:
+        """Combined prompt and completion cost per token, used for ranking."""
+        return self.pricing.prompt_cost + self.pricing.completion_cost
+
+    @cached_property
+    def name_lower(self) -> str:
+        """Display name in lower case, for case-insensitive name matching."""
+        return self.name.lower()
+
+    @cached_property
+    def supported_parameter_set(self) -> FrozenSet[str]:
+        """Supported parameters as a frozenset."""
+        return frozenset(self.supported_parameters)
+
 
 class ModelListResponse(BaseModel):
     """Response from the OpenRouter model listing endpoint."""
@@ -78,7 +162,12 @@ class ModelListResponse(BaseModel):
 
 
 class ModelRequirements(BaseModel):
-    """Requirements for model selection."""
+    """
+    Requirements for model selection.
+
+    Collection fields accept any iterable of strings and are stored as
+    frozensets, so selection can use subset tests directly.
+    """
 
     max_cost_per_token: Optional[float] = Field(
         None, description="Maximum cost per token"
@@ -86,21 +175,22 @@ class ModelRequirements(BaseModel):
     min_context_length: Optional[int] = Field(
         None, description="Minimum required context length"
     )
-    required_features: Optional[List[str]] = Field(
+    required_features: Optional[FrozenSet[str]] = Field(
         None, description="Required features or parameters"
     )
-    input_modalities: Optional[List[str]] = Field(
+    input_modalities: Optional[FrozenSet[str]] = Field(
         None, description="Required input modalities"
     )
-    output_modalities: Optional[List[str]] = Field(
+    output_modalities: Optional[FrozenSet[str]] = Field(
         None, description="Required output modalities"
     )
     prefer_unmoderated: Optional[bool] = Field(
         False, description="Prefer unmoderated providers"
     )
     force_refresh: Optional[bool] = Field(
-        True, description="Force refresh of model list and skip cache"
+        False,
+        description="Revalidate the cached model list with the API, ignoring the cache TTL",
     )
-    exclude_models: Optional[List[str]] = Field(
+    exclude_models: Optional[FrozenSet[str]] = Field(
         None, description="Exclude models from the list"
     )
@@ -1,19 +1,84 @@
+import json
 import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
-# Add the parent directory to the path so we can import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the repository root to the path so we can import our modules
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
 
-from src.client import OpenRouterClient
-from src.models import (
+from src.openrouter_client.client import OpenRouterClient
+from src.openrouter_client.models import (
     Architecture,
     ModelMetadata,
     ModelRequirements,
     Pricing,
     TopProvider,
 )
+from src.utils.logging import LoguruAdapter
+
+
+def make_model(
+    model_id,
+    name,
+    cost,
+    context_length,
+    supported_parameters=("temperature", "top_p"),
+    input_modalities=("text",),
+    is_moderated=True,
+):
+    """
+    Build a test model without running validation.
+
+    The fixtures are trusted literals, so model_construct is used to skip
+    pydantic validation; derived values are still computed on first use.
+    """
+    return ModelMetadata.model_construct(
+        id=model_id,
+        name=name,
+        created=1741818122,
+        description=f"{name} used in tests",
+        architecture=Architecture.model_construct(
+            input_modalities=tuple(input_modalities),
+            output_modalities=("text",),
+            tokenizer="GPT",
+        ),
+        top_provider=TopProvider.model_construct(is_moderated=is_moderated),
+        pricing=Pricing.model_construct(prompt=cost, completion=cost),
+        context_length=context_length,
+        supported_parameters=tuple(supported_parameters),
+    )
+
+
+# Models are frozen, so these fixtures are built once and shared by all tests
+CHEAP_MODEL = make_model("model1", "Cheap Model", "0.0000001", 4096)
+MEDIUM_MODEL = make_model("model2", "Medium Model", "0.000001", 8192)
+EXPENSIVE_MODEL = make_model("model3", "Expensive Model", "0.0001", 16384)
+EXPENSIVE_FEATURE_MODEL = make_model(
+    "model2",
+    "Expensive Model",
+    "0.0001",
+    8192,
+    supported_parameters=("temperature", "top_p", "frequency_penalty"),
+)
+BASIC_MODEL = make_model("model1", "Basic Model", "0.0000007", 4096)
+ADVANCED_MODEL = make_model(
+    "model2",
+    "Advanced Model",
+    "0.000001",
+    8192,
+    supported_parameters=(
+        "temperature",
+        "top_p",
+        "frequency_penalty",
+        "presence_penalty",
+    ),
+    input_modalities=("text", "image"),
+    is_moderated=False,
+)
 
 
 class TestOpenRouterClient(unittest.TestCase):
@@ -23,50 +88,88 @@ class TestOpenRouterClient(unittest.TestCase):
         """Set up test environment."""
         # Mock environment variable
         os.environ["OPENROUTER_API_KEY"] = "test_api_key"
-        self.client = OpenRouterClient()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.client = OpenRouterClient(cache_dir=self.cache_dir.name)
 
     def test_init_with_env_var(self):
         """Test initialization with environment variable."""
         self.assertEqual(self.client.api_key, "test_api_key")
 
+    def test_default_logger_keeps_app_sinks(self):
+        """Test that the fallback logger is silent and leaves the sinks in place."""
+        from loguru import logger
+
+        records = []
+        sink_id = logger.add(records.append, level="DEBUG", format="{message}")
+        self.addCleanup(logger.remove, sink_id)
+
+        client = OpenRouterClient(cache_dir=self.cache_dir.name)
+        client._models_cache = [CHEAP_MODEL]
+        client.select_model(ModelRequirements())
+        logger.info("after client")
+
+        self.assertEqual(records, ["after client\n"])
+
+    def test_loguru_adapter_level(self):
+        """Test that a LoguruAdapter forwards records at or above its level."""
+        from loguru import logger
+
+        records = []
+        sink_id = logger.add(records.append, level="DEBUG", format="{message}")
+        self.addCleanup(logger.remove, sink_id)
+
+        adapter = LoguruAdapter("INFO")
+        self.assertFalse(adapter.debug_mode)
+        adapter.print_debug("hidden")
+        adapter.print_info("shown")
+        adapter.warning("also {}", "shown")
+
+        self.assertEqual(records, ["shown\n", "also shown\n"])
+
     def test_init_with_direct_key(self):
         """Test initialization with direct API key."""
         client = OpenRouterClient(api_key="direct_key")
         self.assertEqual(client.api_key, "direct_key")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_models(self, mock_get):
         """Test fetching models from the API."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "model1",
-                    "name": "Test Model 1",
-                    "created": 1741818122,
-                    "description": "A test model",
-                    "architecture": {
-                        "input_modalities": ["text"],
-                        "output_modalities": ["text"],
-                        "tokenizer": "GPT",
-                    },
-                    "top_provider": {"is_moderated": True},
-                    "pricing": {
-                        "prompt": "0.0000007",
-                        "completion": "0.0000007",
-                        "image": "0",
-                        "request": "0",
-                        "input_cache_read": "0",
-                        "input_cache_write": "0",
-                        "web_search": "0",
-                        "internal_reasoning": "0",
-                    },
-                    "context_length": 8192,
-                    "supported_parameters": ["temperature", "top_p"],
-                }
-            ]
-        }
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"v1"'}
+        payload = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "model1",
+                        "name": "Test Model 1",
+                        "created": 1741818122,
+                        "description": "A test model",
+                        "architecture": {
+                            "input_modalities": ["text"],
+                            "output_modalities": ["text"],
+                            "tokenizer": "GPT",
+                        },
+                        "top_provider": {"is_moderated": True},
+                        "pricing": {
+                            "prompt": "0.0000007",
+                            "completion": "0.0000007",
+                            "image": "0",
+                            "request": "0",
+                            "input_cache_read": "0",
+                            "input_cache_write": "0",
+                            "web_search": "0",
+                            "internal_reasoning": "0",
+                        },
+                        "context_length": 8192,
+                        "supported_parameters": ["temperature", "top_p"],
+                    }
+                ]
+            }
+        ).encode()
+        mock_response.iter_content.return_value = [payload]
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -78,62 +181,94 @@ class TestOpenRouterClient(unittest.TestCase):
         self.assertEqual(models[0].id, "model1")
         self.assertEqual(models[0].name, "Test Model 1")
         self.assertEqual(models[0].context_length, 8192)
+        self.assertEqual(
+            self.client._session.headers["Authorization"], "Bearer test_api_key"
+        )
         mock_get.assert_called_once_with(
             "https://openrouter.ai/api/v1/models",
-            headers={
-                "Authorization": "Bearer test_api_key",
-                "Content-Type": "application/json",
-            },
+            headers=None,
+            timeout=OpenRouterClient.REQUEST_TIMEOUT,
+            stream=True,
         )
+        mock_response.close.assert_called_once()
 
-    def test_model_selection_cost_filter(self):
-        """Test model selection based on cost requirements."""
-        # Create test models
-        model1 = ModelMetadata(
-            id="model1",
-            name="Cheap Model",
-            created=1741818122,
-            description="A cheap model",
-            architecture=Architecture(
-                input_modalities=["text"], output_modalities=["text"], tokenizer="GPT"
-            ),
-            top_provider=TopProvider(is_moderated=True),
-            pricing=Pricing(
-                prompt="0.0000001",
-                completion="0.0000001",
-                image="0",
-                request="0",
-                input_cache_read="0",
-                input_cache_write="0",
-                web_search="0",
-                internal_reasoning="0",
-            ),
-            context_length=4096,
-            supported_parameters=["temperature", "top_p"],
-        )
+    @patch("requests.Session.get")
+    def test_fetch_models_disk_cache(self, mock_get):
+        """Test that a fresh disk cache skips the API and a refresh revalidates."""
+        payload = json.dumps({"data": []}).encode()
+        self.client._disk_cache.save(payload, '"v1"', "Wed, 21 Oct 2015 07:28:00 GMT")
+
+        # A fresh cache is served without any request
+        client = OpenRouterClient(cache_dir=self.cache_dir.name)
+        self.assertEqual(client.fetch_models(), [])
+        mock_get.assert_not_called()
 
-        model2 = ModelMetadata(
-            id="model2",
-            name="Expensive Model",
-            created=1741818122,
-            description="An expensive model",
-            architecture=Architecture(
-                input_modalities=["text"], output_modalities=["text"], tokenizer="GPT"
-            ),
-            top_provider=TopProvider(is_moderated=True),
-            pricing=Pricing(
-                prompt="0.0001",
-                completion="0.0001",
-                image="0",
-                request="0",
-                input_cache_read="0",
-                input_cache_write="0",
-                web_search="0",
-                internal_reasoning="0",
-            ),
-            context_length=8192,
-            supported_parameters=["temperature", "top_p", "frequency_penalty"],
+        # A forced refresh revalidates with the cached ETag and accepts a 304
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+        self.assertEqual(client.fetch_models(force_refresh=True), [])
+        headers = mock_get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"], "Wed, 21 Oct 2015 07:28:00 GMT")
+
+    def test_disk_cache_single_file(self):
+        """Test that the payload and validators are replaced together."""
+        cache = self.client._disk_cache
+        cache.save(b'{"data": []}\n', '"v1"', None)
+        cache.save(b'{"data": [1]}', '"v2"', "Wed, 21 Oct 2015 07:28:00 GMT")
+
+        entry = cache.load()
+        self.assertEqual(entry.payload, b'{"data": [1]}')
+        self.assertEqual(entry.etag, '"v2"')
+        self.assertEqual(entry.last_modified, "Wed, 21 Oct 2015 07:28:00 GMT")
+        # No temporary files are left behind next to the cache file
+        self.assertEqual(os.listdir(self.cache_dir.name), [cache.CACHE_FILE])
+
+        cache.clear()
+        self.assertIsNone(cache.load())
+
+    def test_disk_cache_bad_header(self):
+        """Test that a cache file with an unusable header is treated as missing."""
+        cache = self.client._disk_cache
+        os.makedirs(self.cache_dir.name, exist_ok=True)
+        for header in (b"not json", b"123", b'["etag"]'):
+            cache.path.write_bytes(header + b'\n{"data": []}')
+            self.assertIsNone(cache.load())
+
+    def test_model_copy_rederives_cached_values(self):
+        """Test that updated copies do not keep the original's derived values."""
+        model = make_model("model1", "Model A", "0.000001", 4096)
+        _ = (model.name_lower, model.total_cost, model.supported_parameter_set)
+
+        renamed = model.model_copy(update={"name": "Model B"})
+        self.assertEqual(renamed.name_lower, "model b")
+        self.assertEqual(model.name_lower, "model a")
+
+        repriced = model.model_copy(
+            update={"pricing": model.pricing.model_copy(update={"prompt": "0.001"})}
         )
+        self.assertEqual(repriced.pricing.prompt_cost, 0.001)
+        self.assertAlmostEqual(repriced.total_cost, 0.001001)
+
+        # Plain copies keep the already derived values
+        self.assertIn("name_lower", model.model_copy().__dict__)
+
+    def test_rejection_summary_only_in_debug_mode(self):
+        """Test that the filter summary is only built when debug output is on."""
+        for debug_mode in (False, True):
+            logger = MagicMock(debug_mode=debug_mode)
+            client = OpenRouterClient(logger=logger, cache_dir=self.cache_dir.name)
+            client.select_models(ModelRequirements(), models=[CHEAP_MODEL])
+
+            messages = [call.args[0] for call in logger.print_debug.call_args_list]
+            self.assertEqual(
+                any(m.startswith("Checked 1/1 models") for m in messages), debug_mode
+            )
+
+    def test_model_selection_cost_filter(self):
+        """Test model selection based on cost requirements."""
+        model1, model2 = CHEAP_MODEL, EXPENSIVE_FEATURE_MODEL
 
         # Mock fetch_models to return our test models
         self.client.fetch_models = MagicMock(return_value=[model1, model2])
@@ -150,59 +285,7 @@ class TestOpenRouterClient(unittest.TestCase):
 
     def test_model_selection_feature_filter(self):
         """Test model selection based on feature requirements."""
-        # Create test models
-        model1 = ModelMetadata(
-            id="model1",
-            name="Basic Model",
-            created=1741818122,
-            description="A basic model",
-            architecture=Architecture(
-                input_modalities=["text"], output_modalities=["text"], tokenizer="GPT"
-            ),
-            top_provider=TopProvider(is_moderated=True),
-            pricing=Pricing(
-                prompt="0.0000007",
-                completion="0.0000007",
-                image="0",
-                request="0",
-                input_cache_read="0",
-                input_cache_write="0",
-                web_search="0",
-                internal_reasoning="0",
-            ),
-            context_length=4096,
-            supported_parameters=["temperature", "top_p"],
-        )
-
-        model2 = ModelMetadata(
-            id="model2",
-            name="Advanced Model",
-            created=1741818122,
-            description="An advanced model",
-            architecture=Architecture(
-                input_modalities=["text", "image"],
-                output_modalities=["text"],
-                tokenizer="GPT",
-            ),
-            top_provider=TopProvider(is_moderated=False),
-            pricing=Pricing(
-                prompt="0.000001",
-                completion="0.000001",
-                image="0",
-                request="0",
-                input_cache_read="0",
-                input_cache_write="0",
-                web_search="0",
-                internal_reasoning="0",
-            ),
-            context_length=8192,
-            supported_parameters=[
-                "temperature",
-                "top_p",
-                "frequency_penalty",
-                "presence_penalty",
-            ],
-        )
+        model1, model2 = BASIC_MODEL, ADVANCED_MODEL
 
         # Mock fetch_models to return our test models
         self.client.fetch_models = MagicMock(return_value=[model1, model2])
@@ -224,29 +307,7 @@ class TestOpenRouterClient(unittest.TestCase):
 
     def test_no_matching_models(self):
         """Test behavior when no models match the requirements."""
-        # Create test model
-        model = ModelMetadata(
-            id="model1",
-            name="Test Model",
-            created=1741818122,
-            description="A test model",
-            architecture=Architecture(
-                input_modalities=["text"], output_modalities=["text"], tokenizer="GPT"
-            ),
-            top_provider=TopProvider(is_moderated=True),
-            pricing=Pricing(
-                prompt="0.0001",
-                completion="0.0001",
-                image="0",
-                request="0",
-                input_cache_read="0",
-                input_cache_write="0",
-                web_search="0",
-                internal_reasoning="0",
-            ),
-            context_length=4096,
-            supported_parameters=["temperature", "top_p"],
-        )
+        model = make_model("model1", "Test Model", "0.0001", 4096)
 
         # Mock fetch_models to return our test model
         self.client.fetch_models = MagicMock(return_value=[model])
@@ -262,75 +323,7 @@ class TestOpenRouterClient(unittest.TestCase):
 
     def test_select_multiple_models(self):
         """Test selecting multiple models that meet requirements."""
-        # Create test models
-        model1 = ModelMetadata(
-            id="model1",
-            name="Cheap Model",
-            created=1741818122,
-            description="A cheap model",
-            architecture=Architecture(
-                input_modalities=["text"], output_modalities=["text"], tokenizer="GPT"
-            ),
-            top_provider=TopProvider(is_moderated=True),
-            pricing=Pricing(
-                prompt="0.0000001",
-                completion="0.0000001",
-                image="0",
-                request="0",
-                input_cache_read="0",
-                input_cache_write="0",
-                web_search="0",
-                internal_reasoning="0",
-            ),
-            context_length=4096,
-            supported_parameters=["temperature", "top_p"],
-        )
-
-        model2 = ModelMetadata(
-            id="model2",
-            name="Medium Model",
-            created=1741818122,
-            description="A medium-priced model",
-            architecture=Architecture(
-                input_modalities=["text"], output_modalities=["text"], tokenizer="GPT"
-            ),
-            top_provider=TopProvider(is_moderated=True),
-            pricing=Pricing(
-                prompt="0.000001",
-                completion="0.000001",
-                image="0",
-                request="0",
-                input_cache_read="0",
-                input_cache_write="0",
-                web_search="0",
-                internal_reasoning="0",
-            ),
-            context_length=8192,
-            supported_parameters=["temperature", "top_p"],
-        )
-
-        model3 = ModelMetadata(
-            id="model3",
-            name="Expensive Model",
-            created=1741818122,
-            description="An expensive model",
-            architecture=Architecture(
-                input_modalities=["text"], output_modalities=["text"], tokenizer="GPT"
-            ),
-            top_provider=TopProvider(is_moderated=True),
-            pricing=Pricing(
-                prompt="0.0001",
-                completion="0.0001",
-                image="0",
-                request="0",
-                input_cache_read="0",
-                input_cache_write="0",
-                web_search="0",
-                internal_reasoning="0",
-            ),
-            context_length=16384,
-            supported_parameters=["temperature", "top_p"],
-        )
+        model1, model2, model3 = CHEAP_MODEL, MEDIUM_MODEL, EXPENSIVE_MODEL
 
         # Mock fetch_models to return our test models
         self.client.fetch_models = MagicMock(return_value=[model1, model2, model3])
@@ -344,6 +337,13 @@ class TestOpenRouterClient(unittest.TestCase):
         self.assertEqual(selected_models[0].id, "model1")
         self.assertEqual(selected_models[1].id, "model2")
 
+        # Order comes from cost, not from the catalog order
+        self.client.fetch_models = MagicMock(return_value=[model3, model1, model2])
+        selected_models = self.client.select_models(requirements, limit=0)
+        self.assertEqual(
+            [model.id for model in selected_models], ["model1", "model2", "model3"]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
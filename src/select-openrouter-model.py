@@ -17,19 +17,31 @@ python -m src.select-openrouter-model \
   --log-level INFO \
   --output brief \
   --no-auto \
-  --name-filter "llama"
+  --name-filter "llama" \
+  --refresh
 ```
 
 """
 
 import re
+import sys
 
 import click
-from dotenv import load_dotenv
 
-from src.openrouter_client.client import OpenRouterClient
-from src.openrouter_client.models import ModelRequirements
-from src.utils.logging import LoggerConfig, UnifiedLogger
+# Parameter count in a model name, e.g. "Llama 3.3 70B Instruct" -> "70B"
+MODEL_SIZE_RE = re.compile(r"\s(\d+(?:\.\d+)?B)\s")
+
+# Comma separator with any surrounding whitespace, so splitting also trims
+CSV_RE = re.compile(r"\s*,\s*")
+
+# One log record per model for --output text; fields are filled in lazily by loguru
+MODEL_TEXT_FORMAT = (
+    "{}. {} (ID: {})\n"
+    "  - Model size: {}\n"
+    "  - Context length: {}\n"
+    "  - Pricing: {} per prompt token, {} per completion token\n"
+    "  - Supported parameters: {}"
+)
 
 
 @click.command()
@@ -81,6 +93,12 @@ from src.utils.logging import LoggerConfig, UnifiedLogger
     help="Filter out openrouter auto-router model (openrouter/auto)",
 )
 @click.option("--name-filter", type=str, default=None, help="Filter models by name")
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=False,
+    help="Revalidate the cached model list with OpenRouter even if it is fresh",
+)
 def main(
     max_cost: float,
     min_context: int,
@@ -93,8 +111,19 @@ def main(
     output: str,
     no_auto: bool,
     name_filter: str,
+    refresh: bool,
 ) -> None:
     """Select and display AI models based on specified requirements using OpenRouter."""
+    # Imported here so `--help` and argument errors do not pay for loading
+    # pydantic, loguru, rich and requests
+    from concurrent.futures import ThreadPoolExecutor
+
+    from dotenv import load_dotenv
+
+    from src.openrouter_client.client import OpenRouterClient
+    from src.openrouter_client.models import ModelRequirements
+    from src.utils.logging import LoggerConfig, UnifiedLogger
+
     # Initialize unified logger
     logger = UnifiedLogger(
         LoggerConfig(
@@ -111,12 +140,16 @@ def main(
     # Initialize the client with the logger
     client = OpenRouterClient(logger=logger)
 
+    # Start loading the model list in the background so the HTTP round trip
+    # overlaps with building the requirements
+    executor = ThreadPoolExecutor(max_workers=1)
+    models_future = executor.submit(client.fetch_models, force_refresh=refresh)
+    executor.shutdown(wait=False)
+
     # Parse comma-separated strings into lists
-    feature_list = (
-        None if features is None else [f.strip() for f in features.split(",")]
-    )
-    input_mod_list = [m.strip() for m in input_mods.split(",")]
-    output_mod_list = [m.strip() for m in output_mods.split(",")]
+    feature_list = None if features is None else CSV_RE.split(features.strip())
+    input_mod_list = CSV_RE.split(input_mods.strip())
+    output_mod_list = CSV_RE.split(output_mods.strip())
 
     # Define requirements for model selection
     requirements = ModelRequirements(
@@ -126,42 +159,53 @@ def main(
         input_modalities=input_mod_list,
         output_modalities=output_mod_list,
         prefer_unmoderated=prefer_unmoderated,
-        force_refresh=True,
+        force_refresh=refresh,
         exclude_models=["openrouter/auto"] if no_auto else None,
     )
 
     # Select a model based on requirements
-    models = client.select_models(requirements, limit=limit)
+    models = client.select_models(
+        requirements, limit=limit, models=models_future.result()
+    )
     if name_filter:
-        models = [
-            model for model in models if name_filter.lower() in model.name.lower()
-        ]
+        name_filter = name_filter.lower()
+        models = [model for model in models if name_filter in model.name_lower]
 
     if output == "text":
-        logger.debug(f"Model selection requirements: {requirements}")
+        logger.debug("Model selection requirements: {}", requirements)
         if len(models) > 0:
             for i, model in enumerate(models, 1):
                 # Extract model size parameter using regex
-                parameters = re.search(r"\s(\d+(?:\.\d+)?B)\s", model.name)
+                parameters = MODEL_SIZE_RE.search(model.name)
                 param_size = parameters.group(1) if parameters else "N/A"
 
-                logger.info(f"{i}. {model.name} (ID: {model.id})")
-                logger.info(f"  - Model size: {param_size}")
-                logger.info(f"  - Context length: {model.context_length}")
-                logger.info(
-                    f"  - Pricing: {model.pricing.prompt} per prompt token, {model.pricing.completion} per completion token"
-                )
                 logger.info(
-                    f"  - Supported parameters: {', '.join(model.supported_parameters)}"
+                    MODEL_TEXT_FORMAT,
+                    i,
+                    model.name,
+                    model.id,
+                    param_size,
+                    model.context_length,
+                    model.pricing.prompt,
+                    model.pricing.completion,
+                    ", ".join(model.supported_parameters),
                 )
         else:
             logger.info("No model found matching the requirements")
 
     elif output == "json":
-        model_json = [model.model_dump() for model in models]
-        logger.print_json(model_json, "Selected Models")
+        # Let queued log records reach the console first so they cannot land
+        # inside the array, then stream it to stdout one model at a time, so
+        # memory is bounded by a single model's JSON rather than the whole list
+        logger.wait_written()
+        write = sys.stdout.write
+        write("[")
+        for i, model in enumerate(models):
+            write(",\n" if i else "\n")
+            write(model.model_dump_json(indent=2))
+        write("\n]\n" if models else "]\n")
     elif output == "brief":
-        logger.debug(f"Model selection requirements: {requirements}")
+        logger.debug("Model selection requirements: {}", requirements)
         if len(models) > 0:
             for i, model in enumerate(models, 1):
                 logger.info(f"{i}. {model.name} (ID: {model.id})")
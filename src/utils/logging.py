@@ -1,16 +1,166 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import functools
 import json
 import logging
+import os
 import sys
-from typing import Any, Dict, Literal, Optional
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager, suppress
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 from loguru import logger
-from pydantic import BaseModel, Field
-from rich.console import Console
-from rich.panel import Panel
-from rich.theme import Theme
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import orjson
+except ImportError:  # Optional; the standard library encoder is used instead
+    orjson = None
+
+# Loguru level names for the standard logging level numbers. Other (custom)
+# levels are passed to loguru by number.
+_STD_LEVEL_NAMES = {
+    logging.CRITICAL: "CRITICAL",
+    logging.ERROR: "ERROR",
+    logging.WARNING: "WARNING",
+    logging.INFO: "INFO",
+    logging.DEBUG: "DEBUG",
+}
+
+# Source file of the logging module, for skipping its frames in stack walks.
+# Taken from a code object rather than logging.__file__: the module's code
+# objects share this string object, so comparing a frame's co_filename with it
+# succeeds on the identity check before any characters are compared.
+_LOGGING_FILE = logging.Handler.handle.__code__.co_filename
+
+DEFAULT_LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+MESSAGE_LOG_FORMAT = "{message}"
+
+# Rich theme styles used for console output, by message type
+CONSOLE_STYLES = {
+    "info": "cyan",
+    "success": "green",
+    "warning": "yellow",
+    "error": "red",
+    "debug": "dim cyan",
+    "agent": "magenta",
+    "task": "blue",
+    "crew": "bold green",
+    "input": "bold yellow",
+    "output": "bold white",
+    "json": "bold cyan",
+}
+
+
+def _json_dumps(
+    data: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    """
+    Serialize data to a JSON string, using orjson when it is installed.
+
+    Args:
+        data: JSON-compatible data to serialize
+        indent: Whether to pretty-print with two-space indentation
+        default: Optional fallback converter for values JSON cannot represent
+
+    Returns:
+        The serialized JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=option).decode()
+    return json.dumps(data, indent=2 if indent else None, default=default)
+
+
+# Simple message kinds printed through UnifiedLogger.emit:
+# kind -> (panel title, log level, log message template)
+MESSAGE_KINDS = {
+    "info": ("Information", "INFO", "{}"),
+    "success": ("Success", "INFO", "Success: {}"),
+    "warning": ("Warning", "WARNING", "{}"),
+    "error": ("Error", "ERROR", "{}"),
+}
+
+# Logs on behalf of the function that called the current one, so records from
+# UnifiedLogger.emit name the print_* method (or user code) that called it
+_log_for_caller = logger.opt(depth=1).log
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Accept any arguments and do nothing."""
+
+
+def _should_colorize(stream: TextIO) -> bool:
+    """
+    Decide whether console records written to stream get ANSI colors.
+
+    loguru only makes this decision for streams it is given directly, and
+    QueuedSink hides the real stream from it, so the console sink decides up
+    front. Colors are used on terminals and in consoles that render ANSI codes
+    without being a TTY (PyCharm and the common CI services).
+    """
+    if "PYCHARM_HOSTED" in os.environ:
+        return True
+    if "CI" in os.environ and any(
+        ci in os.environ
+        for ci in ("TRAVIS", "CIRCLECI", "APPVEYOR", "GITLAB_CI", "GITHUB_ACTIONS")
+    ):
+        return True
+    try:
+        return stream.isatty()
+    except Exception:
+        return False
+
+
+def _ansi_stream(stream: TextIO) -> TextIO:
+    """
+    Return a stream that renders ANSI colors written to stream.
+
+    Like loguru does for the standard streams, a Windows console that cannot
+    enable ANSI processing is wrapped with colorama (installed with loguru on
+    Windows), which converts the codes to console calls. Any other stream is
+    returned unchanged.
+    """
+    if os.name != "nt" or stream is not sys.__stdout__:
+        return stream
+    try:
+        from colorama import AnsiToWin32
+        from colorama.win32 import winapi_test
+    except ImportError:
+        return stream
+    if not winapi_test():
+        return stream
+    try:
+        from colorama.winterm import enable_vt_processing
+
+        if enable_vt_processing(stream.fileno()):
+            return stream
+    except Exception:
+        pass
+    return AnsiToWin32(stream, convert=True, strip=True, autoreset=False).stream
 
 
 class LoggerConfig(BaseModel):
@@ -18,6 +168,8 @@ class LoggerConfig(BaseModel):
     Pydantic model for unified logger configuration.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     # Logging configuration
     log_level: Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "TRACE"] = (
         Field(default="INFO", description="Logging level.")
@@ -43,6 +195,286 @@ class LoggerConfig(BaseModel):
         default=False, description="Use terse output format (no borders or titles)."
     )
 
+    # Console queue configuration
+    queue_size: int = Field(
+        default=10_000,
+        gt=0,
+        description="Maximum number of console records waiting to be written.",
+    )
+    overflow_policy: Literal["drop_new", "drop_oldest", "block"] = Field(
+        default="drop_new",
+        description="What to do with a console record when the queue is full.",
+    )
+    console_batch_size: int = Field(
+        default=256,
+        gt=0,
+        description="Maximum number of console records written in one call.",
+    )
+    console_flush_interval_ms: int = Field(
+        default=0,
+        ge=0,
+        description="How long the console writer waits to fill a batch, in ms.",
+    )
+
+
+class QueuedSink:
+    """
+    Loguru sink that hands formatted records to a background writer thread.
+
+    Records go into a bounded buffer. When the writer falls behind, the
+    overflow policy decides whether the newest record is dropped, the oldest
+    buffered record is dropped to make room, or the caller blocks. The number
+    of dropped records is reported periodically on the stream itself.
+
+    The buffer is a deque, whose append and popleft are atomic, so the logging
+    call only appends and sets an event when the writer is idle; there is no
+    lock or condition round trip per record as with queue.Queue. The writer
+    thread joins whatever is buffered (up to a batch size) into a single write
+    and flush, so a burst of records costs one write call rather than one per
+    record.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        max_size: int = 10_000,
+        overflow_policy: str = "drop_new",
+        batch_size: int = 256,
+        flush_interval: float = 0.0,
+        report_interval: float = 10.0,
+    ):
+        """
+        Initialize the sink and start its writer thread.
+
+        Args:
+            stream: Stream that receives the formatted records.
+            max_size: Maximum number of records waiting to be written.
+            overflow_policy: "drop_new", "drop_oldest" or "block".
+            batch_size: Maximum number of records joined into one write.
+            flush_interval: Seconds to wait for more records before writing a
+                    partial batch. 0 writes whatever is already buffered.
+            report_interval: Minimum seconds between dropped-record reports.
+        """
+        self._stream = stream
+        # Formatted records, plus Event markers from wait_written() and a final
+        # None stop marker from stop()
+        self._records: Deque[Union[str, threading.Event, None]] = deque()
+        self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._has_records = threading.Event()
+        self._has_space = threading.Event()
+        self._report_interval = report_interval
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._last_report = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """Buffer a record for writing, applying the overflow policy if the buffer is full."""
+        if len(self._records) >= self._max_size and not self._make_room():
+            return
+        self._records.append(message)
+        if not self._has_records.is_set():
+            self._has_records.set()
+
+    def isatty(self) -> bool:
+        """Report whether the underlying stream is a terminal."""
+        try:
+            return self._stream.isatty()
+        except Exception:
+            return False
+
+    def wait_written(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every record buffered before this call has been written.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait as long
+                    as the writer is running.
+
+        Returns:
+            True if the records were written, False on timeout.
+        """
+        if not self._thread.is_alive():
+            return True
+        written = threading.Event()
+        self._records.append(written)
+        self._has_records.set()
+        return written.wait(timeout)
+
+    def stop(self) -> None:
+        """Write any buffered records and stop the writer thread."""
+        self._records.append(None)
+        self._has_records.set()
+        self._thread.join()
+
+    def _make_room(self) -> bool:
+        """
+        Apply the overflow policy to a full buffer.
+
+        Returns:
+            True if the new record should still be buffered.
+        """
+        if self._overflow_policy == "block":
+            while len(self._records) >= self._max_size and self._thread.is_alive():
+                self._has_space.clear()
+                if len(self._records) >= self._max_size:
+                    self._has_space.wait(0.1)
+            return True
+
+        keep = False
+        if self._overflow_policy == "drop_oldest":
+            oldest: Union[str, threading.Event, None] = ""
+            # The writer may empty the buffer between the size check and here
+            with suppress(IndexError):
+                oldest = self._records.popleft()
+            if isinstance(oldest, str):
+                keep = True
+            else:
+                # Never drop a wait_written() or stop marker
+                self._records.appendleft(oldest)
+
+        with self._dropped_lock:
+            self._dropped += 1
+        return keep
+
+    def _run(self) -> None:
+        """Writer thread loop."""
+        while True:
+            batch = self._next_batch()
+            marker = batch.pop() if batch and not isinstance(batch[-1], str) else ""
+            stop = marker is None
+            try:
+                if batch:
+                    self._stream.write("".join(batch))
+                self._report_dropped(force=stop)
+                self._stream.flush()
+            except (OSError, ValueError):
+                # The stream was closed or broke (e.g. at interpreter exit);
+                # keep draining so producers never block on a dead writer
+                pass
+            if stop:
+                return
+            if marker:
+                marker.set()
+
+    def _next_batch(self) -> List[Union[str, threading.Event, None]]:
+        """
+        Wait for records, then collect more until the batch is full or the
+        flush interval passes. A marker (see _records) always ends the batch.
+        """
+        if not self._records:
+            self._has_records.wait()
+        # Clear before draining: a record appended after the drain sets the
+        # event again, so it is never left waiting
+        self._has_records.clear()
+        batch = self._drain(self._batch_size)
+
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._batch_size and (
+            not batch or isinstance(batch[-1], str)
+        ):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._has_records.wait(remaining):
+                break
+            self._has_records.clear()
+            batch.extend(self._drain(self._batch_size - len(batch)))
+        return batch
+
+    def _drain(self, limit: int) -> List[Union[str, threading.Event, None]]:
+        """Take up to limit buffered records, stopping after a marker."""
+        batch: List[Union[str, threading.Event, None]] = []
+        popleft = self._records.popleft
+        while len(batch) < limit:
+            try:
+                message = popleft()
+            except IndexError:
+                break
+            batch.append(message)
+            if not isinstance(message, str):
+                break
+        self._has_space.set()
+        return batch
+
+    def _report_dropped(self, force: bool = False) -> None:
+        """Write a notice about dropped records if any were dropped recently."""
+        now = time.monotonic()
+        if not force and now - self._last_report < self._report_interval:
+            return
+        self._last_report = now
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            self._stream.write(f"[logging] dropped {dropped} log records\n")
+
+
+class JsonRecordSink:
+    """
+    Loguru sink wrapper that writes each record as one compact JSON line.
+
+    Used for JSON console logs instead of loguru's serialize=True, which
+    encodes the full record plus the formatted text with the standard library
+    encoder. Only the fields needed to read the log are kept, and they are
+    encoded with orjson when it is installed.
+    """
+
+    def __init__(self, stream: Any):
+        """
+        Initialize the sink.
+
+        Args:
+            stream: Sink or stream that receives the JSON lines.
+        """
+        self._stream = stream
+
+    def write(self, message: Any) -> None:
+        """Encode the record behind a loguru message and pass it on."""
+        record = message.record
+        data = {
+            "time": record["time"].isoformat(),
+            "level": record["level"].name,
+            "message": record["message"],
+            "name": record["name"],
+            "function": record["function"],
+            "line": record["line"],
+        }
+        if record["extra"]:
+            data["extra"] = record["extra"]
+        exception = record["exception"]
+        if exception:
+            data["exception"] = {
+                "type": exception.type.__name__ if exception.type else None,
+                "value": str(exception.value),
+                "traceback": "".join(traceback.format_exception(*exception)),
+            }
+        self._stream.write(_json_dumps(data, default=str) + "\n")
+
+    def isatty(self) -> bool:
+        """JSON lines are never colorized."""
+        return False
+
+    def stop(self) -> None:
+        """Stop the wrapped sink, if it needs stopping."""
+        stop = getattr(self._stream, "stop", None)
+        if stop is not None:
+            stop()
+
+
+class _ConsoleThreadState(threading.local):
+    """Per-thread console state of a UnifiedLogger; class attributes are the defaults."""
+
+    # Panel reused for every panel this thread prints
+    panel: Any = None
+    # Nesting depth of UnifiedLogger.batch() blocks
+    batch_depth = 0
+    # Agent messages waiting to be merged: (agent name, style, messages)
+    agent_pending: Optional[Tuple[str, str, List[str]]] = None
+
 
 class UnifiedLogger:
     """
@@ -56,60 +488,69 @@ class UnifiedLogger:
             config (LoggerConfig): Logger configuration.
         """
         self.config = config
+        self._terse = config.terse
+        self._thread_state = _ConsoleThreadState()
         self.debug_mode = config.log_level == "DEBUG" or config.log_level == "TRACE"
 
         # Initialize rich console if enabled
         if config.use_rich_console:
-            custom_theme = Theme(
-                {
-                    "info": "cyan",
-                    "success": "green",
-                    "warning": "yellow",
-                    "error": "red",
-                    "debug": "dim cyan",
-                    "agent": "magenta",
-                    "task": "blue",
-                    "crew": "bold green",
-                    "input": "bold yellow",
-                    "output": "bold white",
-                    "json": "bold cyan",
-                }
-            )
-            self.console = Console(theme=custom_theme)
+            # rich is imported only when a console is used
+            from rich.console import Console
+            from rich.panel import Panel
+            from rich.text import Text
+            from rich.theme import Theme
+
+            self.console = Console(theme=Theme(CONSOLE_STYLES))
+            # Kept for _render, which runs for every console message
+            self._panel_cls = Panel
+            self._text_cls = Text
         else:
             self.console = None
 
         # Remove default logger to avoid duplicate logs
         logger.remove()
 
-        # Format config
+        # Format config. Message-only formats have no color markup, so colorizing
+        # is switched off for them. For the default format it is decided once
+        # from sys.stdout below; either way loguru precompiles the format with
+        # or without colors when the sink is added, not per record.
         if config.json_logs:
-            log_format = "{message}"
+            log_format = MESSAGE_LOG_FORMAT
             serialize = True
+            colorize = False
         elif config.minimal_console:
-            log_format = "{message}"
+            log_format = MESSAGE_LOG_FORMAT
             serialize = False
+            colorize = False
         else:
-            log_format = (
-                "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-                "<level>{level: <8}</level> | "
-                "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-                "<level>{message}</level>"
-            )
+            log_format = DEFAULT_LOG_FORMAT
             serialize = False
-
-        # Console sink
+            colorize = _should_colorize(sys.stdout)
+
+        # Console sink, written from a background thread through a bounded
+        # queue so a slow terminal cannot block the caller or grow memory
+        self._console_queue = QueuedSink(
+            _ansi_stream(sys.stdout) if colorize else sys.stdout,
+            max_size=config.queue_size,
+            overflow_policy=config.overflow_policy,
+            batch_size=config.console_batch_size,
+            flush_interval=config.console_flush_interval_ms / 1000,
+        )
+        console_sink: Any = self._console_queue
+        if config.json_logs:
+            console_sink = JsonRecordSink(console_sink)
         logger.add(
-            sys.stdout,
+            console_sink,
             level=config.log_level,
             format=log_format,
+            colorize=colorize,
             backtrace=config.backtrace,
             diagnose=config.diagnose,
-            serialize=serialize,
-            enqueue=True,
         )
 
-        # File sink (optional)
+        # File sink (optional). Written synchronously: loguru's enqueue=True
+        # queue is unbounded, and rotation needs loguru's own file handling,
+        # which also means JSON file logs use loguru's serializer.
         if config.log_to_file:
             logger.add(
                 config.log_file_path,
@@ -120,24 +561,50 @@ class UnifiedLogger:
                 backtrace=config.backtrace,
                 diagnose=config.diagnose,
                 serialize=serialize,
-                enqueue=True,
             )
 
         self._intercept_std_logging()
 
+        # Helpers that can never produce output for this configuration become
+        # no-ops, so calls skip the checks inside them. debug() is left alone:
+        # it always reaches loguru, so DEBUG sinks added through get_logger()
+        # still receive its records.
+        if self.console is None:
+            self._format_output = _noop
+        if not self.debug_mode:
+            self.print_debug = _noop
+            self.print_debug_json = _noop
+            self.print_input = _noop
+
     def _intercept_std_logging(self):
         """Intercept standard logging module output to loguru."""
 
         class InterceptHandler(logging.Handler):
+            # Stack depth from emit() to the original caller, keyed by call site.
+            # A given call site always reaches emit() through the same logging
+            # frames, so the frame walk only runs the first time it logs.
+            _depths: Dict[tuple, int] = {}
+            # loguru log methods with the depth option applied, by depth. Each
+            # logger.opt() call builds a new logger, so they are made once.
+            _log_methods: Dict[int, Callable[..., None]] = {}
+
             def emit(self, record):
-                level = logger.level(record.levelname).name
-                frame, depth = logging.currentframe(), 2
-                while frame.f_code.co_filename == logging.__file__:
-                    frame = frame.f_back
-                    depth += 1
-                logger.opt(depth=depth, exception=record.exc_info).log(
-                    level, record.getMessage()
-                )
+                level = _STD_LEVEL_NAMES.get(record.levelno, record.levelno)
+                key = (record.pathname, record.lineno)
+                depth = self._depths.get(key)
+                if depth is None:
+                    frame, depth = sys._getframe(1), 1
+                    while frame and frame.f_code.co_filename == _LOGGING_FILE:
+                        frame = frame.f_back
+                        depth += 1
+                    self._depths[key] = depth
+                if record.exc_info:
+                    log = logger.opt(depth=depth, exception=record.exc_info).log
+                else:
+                    log = self._log_methods.get(depth)
+                    if log is None:
+                        log = self._log_methods[depth] = logger.opt(depth=depth).log
+                log(level, record.getMessage())
 
         logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
 
@@ -145,18 +612,60 @@ class UnifiedLogger:
         """Get the underlying loguru logger instance."""
         return logger
 
+    def wait_written(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until console log records emitted so far have been written.
+
+        Call before writing to stdout directly, so that output does not
+        interleave with records still queued for the console writer thread.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None for no limit.
+
+        Returns:
+            True if the records were written, False on timeout.
+        """
+        return self._console_queue.wait_written(timeout)
+
     def print_debug(self, message: str, title: str = "Debug Information") -> None:
         """Print debug messages with rich formatting."""
         if self.debug_mode:
             self._format_output(message, "debug", title)
             logger.debug(message)
 
+    # The print_* methods below pass their values to loguru as arguments rather
+    # than f-strings, so the log message is only assembled if a sink accepts it.
+
     def print_agent_message(
         self, agent_name: str, message: str, style: str = "agent"
     ) -> None:
-        """Print a message from an agent with rich formatting."""
-        self._format_output(message, style, agent_name)
-        logger.info(f"Agent {agent_name}: {message}")
+        """
+        Print a message from an agent with rich formatting.
+
+        Inside batch(), consecutive messages from the same agent are shown
+        together in one panel. Each message is still logged as its own record.
+        """
+        logger.info("Agent {}: {}", agent_name, message)
+        state = self._thread_state
+        if not state.batch_depth:
+            self._format_output(message, style, agent_name)
+            return
+
+        pending = state.agent_pending
+        if pending is not None and pending[:2] == (agent_name, style):
+            pending[2].append(message)
+            return
+        self.flush_agent_messages()
+        state.agent_pending = (agent_name, style, [message])
+
+    def flush_agent_messages(self) -> None:
+        """Print this thread's agent messages still waiting to be merged."""
+        state = self._thread_state
+        pending = state.agent_pending
+        if pending is not None:
+            state.agent_pending = None
+            agent_name, style, messages = pending
+            self._render("\n".join(messages), style, agent_name)
 
     def print_task_status(
         self, task_name: str, status: str, details: Optional[str] = None
@@ -166,53 +675,76 @@ class UnifiedLogger:
         if details:
             content += f"\n\n{details}"
         self._format_output(content, "task", "Task Update")
-        logger.info(
-            f"Task {task_name} - Status: {status}"
-            + (f" - {details}" if details else "")
-        )
+        if details:
+            logger.info("Task {} - Status: {} - {}", task_name, status, details)
+        else:
+            logger.info("Task {} - Status: {}", task_name, status)
 
     def print_crew_status(self, message: str, status_type: str = "info") -> None:
         """Print crew status messages with rich formatting."""
         self._format_output(message, status_type, "Crew Status")
-        logger.info(f"Crew Status: {message}")
+        logger.info("Crew Status: {}", message)
 
     def print_input(self, input_data: Dict[str, Any]) -> None:
         """Print formatted input data with rich formatting."""
         if self.debug_mode:
-            content = json.dumps(input_data, indent=2)
+            content = _json_dumps(input_data, indent=True)
             self._format_output(content, "input", "Input Data")
-            logger.debug(f"Input Data: {json.dumps(input_data)}")
+            logger.debug("Input Data: {}", content)
 
     def print_output(self, output_data: Any) -> None:
         """Print formatted output data with rich formatting."""
         content = (
-            json.dumps(output_data, indent=2)
+            _json_dumps(output_data, indent=True)
             if isinstance(output_data, dict)
             else str(output_data)
         )
         self._format_output(content, "output", "Output")
-        logger.info(f"Output: {output_data}")
+        logger.info("Output: {}", content)
+
+    def emit(self, kind: str, message: str) -> None:
+        """
+        Print a message of a given kind with rich formatting and log it.
+
+        Args:
+            kind: Message kind, one of the keys of MESSAGE_KINDS. Also used as
+                  the console style.
+            message: The message to display and log
+        """
+        title, level, template = MESSAGE_KINDS[kind]
+        self._format_output(message, kind, title)
+        _log_for_caller(level, template, message)
+
+    def print_warning(self, message: str) -> None:
+        """Print warning messages with rich formatting."""
+        self.emit("warning", message)
 
     def print_error(self, error_message: str) -> None:
         """Print error messages with rich formatting."""
-        self._format_output(error_message, "error", "Error")
-        logger.error(error_message)
+        self.emit("error", error_message)
 
     def print_success(self, message: str) -> None:
         """Print success messages with rich formatting."""
-        self._format_output(message, "success", "Success")
-        logger.info(f"Success: {message}")
+        self.emit("success", message)
 
     def print_info(self, message: str) -> None:
         """Print general information messages with rich formatting."""
-        self._format_output(message, "info", "Information")
-        logger.info(message)
+        self.emit("info", message)
 
-    def print_json(self, data: Dict[str, Any], title: str = "JSON Data") -> None:
-        """Print formatted JSON data with rich formatting."""
-        content = json.dumps(data, indent=2)
+    def print_json(
+        self, data: Union[Dict[str, Any], List[Any]], title: str = "JSON Data"
+    ) -> None:
+        """
+        Print formatted JSON data with rich formatting.
+
+        Args:
+            data: Data to print
+            title: Optional title for the panel
+        """
+        # Serialize once and reuse the text for both the panel and the record
+        content = _json_dumps(data, indent=True)
         self._format_output(content, "json", title)
-        logger.debug(f"{title}: {json.dumps(data)}")
+        logger.debug("{}: {}", title, content)
 
     def print_debug_json(
         self, data: Dict[str, Any], title: str = "Debug JSON Data"
@@ -228,30 +760,53 @@ class UnifiedLogger:
         if self.debug_mode:
             self.print_json(data, title)
 
-    # Direct logging methods
-    def debug(self, message: str) -> None:
+    # Direct logging methods. Extra positional arguments are substituted into
+    # "{}" placeholders by loguru, only if the record is actually emitted.
+    def debug(self, message: str, *args: Any) -> None:
         """Log a debug message."""
-        logger.debug(message)
+        logger.debug(message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Log an info message."""
-        logger.info(message)
+        logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log a warning message."""
-        logger.warning(message)
+        logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log an error message."""
-        logger.error(message)
+        logger.error(message, *args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         """Log a critical message."""
-        logger.critical(message)
+        logger.critical(message, *args)
 
-    def exception(self, message: str) -> None:
+    def exception(self, message: str, *args: Any) -> None:
         """Log an exception message with traceback."""
-        logger.exception(message)
+        logger.exception(message, *args)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Buffer rich console output within the block and write it once on exit.
+
+        Use around loops that print many messages so the console renders and
+        writes them together instead of once per message. Consecutive agent
+        messages printed in the block are merged into one panel per agent.
+        """
+        if not self.console:
+            yield
+            return
+        state = self._thread_state
+        with self.console:
+            state.batch_depth += 1
+            try:
+                yield
+            finally:
+                state.batch_depth -= 1
+                if not state.batch_depth:
+                    self.flush_agent_messages()
 
     def _format_output(
         self, message: str, style: str, title: Optional[str] = None
@@ -259,6 +814,21 @@ class UnifiedLogger:
         """
         Internal method to format output based on terse mode.
 
+        Args:
+            message: The message to display
+            style: The style to use for formatting
+            title: Optional title for the output
+        """
+        # Merged agent messages came first, so they are printed first
+        if self._thread_state.agent_pending is not None:
+            self.flush_agent_messages()
+        self._render(message, style, title)
+
+    def _render(self, message: str, style: str, title: Optional[str] = None) -> None:
+        """
+        Print a message to the rich console, as a styled line in terse mode or
+        as a panel otherwise.
+
         Args:
             message: The message to display
             style: The style to use for formatting
@@ -267,26 +837,128 @@ class UnifiedLogger:
         if not self.console:
             return
 
-        if self.config.terse:
-            # In terse mode, just print the message with style
-            if title:
-                self.console.print(f"[{style}]{title}:[/{style}] {message}")
-            else:
-                self.console.print(f"[{style}]{message}[/{style}]")
-        else:
-            # In normal mode, use panels with borders and titles
+        if self._terse:
+            # In terse mode, just print the message with style. Building the Text
+            # directly skips markup parsing, so brackets in messages print as-is.
             if title:
                 self.console.print(
-                    Panel(
-                        message,
-                        title=f"[{style}]{title}[/{style}]",
-                        border_style=style,
-                    )
+                    self._text_cls.assemble((f"{title}:", style), " ", message)
                 )
             else:
-                self.console.print(
-                    Panel(
-                        message,
-                        border_style=style,
-                    )
-                )
+                self.console.print(self._text_cls(message, style=style))
+        else:
+            # In normal mode, use panels with borders and titles. Each thread
+            # reuses one Panel, which console.print renders immediately, and
+            # the title is styled as Text rather than markup parsed per call.
+            panel = self._thread_state.panel
+            if panel is None:
+                panel = self._thread_state.panel = self._panel_cls("")
+            panel.renderable = message
+            panel.title = self._text_cls(title, style=style) if title else None
+            panel.border_style = style
+            self.console.print(panel)
+
+
+class LoguruAdapter:
+    """
+    Minimal stand-in for UnifiedLogger that only forwards records to loguru.
+
+    It adds no sinks, removes none and does not touch the standard logging
+    module, so a library can fall back to it without changing how the host
+    application has configured logging. Only records at or above the given
+    level are forwarded; without a level the adapter is silent, since loguru's
+    own default stderr sink would otherwise print every record.
+    """
+
+    # Level of the records each method emits
+    METHOD_LEVELS = {
+        "debug": "DEBUG",
+        "print_debug": "DEBUG",
+        "print_json": "DEBUG",
+        "print_debug_json": "DEBUG",
+        "info": "INFO",
+        "print_info": "INFO",
+        "print_success": "INFO",
+        "warning": "WARNING",
+        "print_warning": "WARNING",
+        "error": "ERROR",
+        "print_error": "ERROR",
+    }
+
+    def __init__(self, level: Optional[str] = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            level: Lowest level forwarded to loguru, or None to forward nothing.
+        """
+        min_level = logger.level(level).no if level else None
+        self.debug_mode = (
+            min_level is not None and min_level <= logger.level("DEBUG").no
+        )
+
+        # Methods below the level become no-ops, so their arguments are never
+        # formatted
+        for name, method_level in self.METHOD_LEVELS.items():
+            if min_level is None or logger.level(method_level).no < min_level:
+                setattr(self, name, _noop)
+
+    def print_debug(self, message: str, _title: str = "Debug Information") -> None:
+        """Log a debug message."""
+        _log_for_caller("DEBUG", "{}", message)
+
+    def print_info(self, message: str) -> None:
+        """Log an info message."""
+        _log_for_caller("INFO", "{}", message)
+
+    def print_success(self, message: str) -> None:
+        """Log a success message."""
+        _log_for_caller("INFO", "Success: {}", message)
+
+    def print_warning(self, message: str) -> None:
+        """Log a warning message."""
+        _log_for_caller("WARNING", "{}", message)
+
+    def print_error(self, error_message: str) -> None:
+        """Log an error message."""
+        _log_for_caller("ERROR", "{}", error_message)
+
+    def print_json(
+        self, data: Union[Dict[str, Any], List[Any]], title: str = "JSON Data"
+    ) -> None:
+        """Log JSON data as a debug record."""
+        _log_for_caller("DEBUG", "{}: {}", title, _json_dumps(data))
+
+    def print_debug_json(
+        self, data: Dict[str, Any], title: str = "Debug JSON Data"
+    ) -> None:
+        """Log JSON data as a debug record."""
+        _log_for_caller("DEBUG", "{}: {}", title, _json_dumps(data))
+
+    def debug(self, message: str, *args: Any) -> None:
+        """Log a debug message."""
+        _log_for_caller("DEBUG", message, *args)
+
+    def info(self, message: str, *args: Any) -> None:
+        """Log an info message."""
+        _log_for_caller("INFO", message, *args)
+
+    def warning(self, message: str, *args: Any) -> None:
+        """Log a warning message."""
+        _log_for_caller("WARNING", message, *args)
+
+    def error(self, message: str, *args: Any) -> None:
+        """Log an error message."""
+        _log_for_caller("ERROR", message, *args)
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_logger() -> LoguruAdapter:
+    """
+    Return a shared logger for library code that is not given one.
+
+    This is a silent LoguruAdapter, not a UnifiedLogger: building a
+    UnifiedLogger replaces the loguru sinks and the standard logging handlers,
+    which a library default must never do.
+    """
+    return LoguruAdapter()
@@ -0,0 +1,325 @@
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Add the repository root to the path so we can import our modules
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from loguru import logger
+from rich.console import Console
+from rich.theme import Theme
+
+from src.utils.logging import (
+    CONSOLE_STYLES,
+    JsonRecordSink,
+    LoggerConfig,
+    QueuedSink,
+    UnifiedLogger,
+    _should_colorize,
+)
+
+
+class TestAgentMessages(unittest.TestCase):
+    """Test cases for merging agent messages on the rich console."""
+
+    def setUp(self):
+        """Set up a terse logger whose console writes to a buffer."""
+        self.output = io.StringIO()
+        self.logger = UnifiedLogger(LoggerConfig(log_level="ERROR", terse=True))
+        self.addCleanup(logger.remove)
+        self.logger.console = Console(
+            file=self.output, theme=Theme(CONSOLE_STYLES), width=80
+        )
+
+    def test_messages_outside_batch_print_immediately(self):
+        """Test that agent messages outside batch() are not held back."""
+        self.logger.print_agent_message("alice", "one")
+        self.assertEqual(self.output.getvalue(), "alice: one\n")
+
+    def test_same_agent_messages_merge_in_batch(self):
+        """Test that consecutive messages from one agent share one output."""
+        with self.logger.batch():
+            self.logger.print_agent_message("alice", "one")
+            self.logger.print_agent_message("alice", "two")
+            self.logger.print_agent_message("bob", "three")
+
+        self.assertEqual(self.output.getvalue(), "alice: one\ntwo\nbob: three\n")
+
+    def test_batch_keeps_message_order(self):
+        """Test that merged agent messages stay in order with other output."""
+        with self.logger.batch():
+            self.logger.print_info("first")
+            self.logger.print_agent_message("alice", "second")
+            self.logger.print_agent_message("alice", "third")
+            self.logger.print_info("fourth")
+            self.logger.print_agent_message("alice", "fifth")
+
+        self.assertEqual(
+            self.output.getvalue(),
+            "Information: first\n"
+            "alice: second\nthird\n"
+            "Information: fourth\n"
+            "alice: fifth\n",
+        )
+
+
+class TestDebugRouting(unittest.TestCase):
+    """Test cases for debug records below the configured log level."""
+
+    def test_debug_reaches_added_sinks(self):
+        """Test that debug() reaches a DEBUG sink added through get_logger()."""
+        unified = UnifiedLogger(LoggerConfig(log_level="INFO"))
+        self.addCleanup(logger.remove)
+        stream = io.StringIO()
+        unified.get_logger().add(stream, level="DEBUG", format="{message}")
+
+        unified.debug("value: {}", 42)
+        self.assertEqual(stream.getvalue(), "value: 42\n")
+
+
+class TestInterceptHandler(unittest.TestCase):
+    """Test cases for routing standard logging records to loguru."""
+
+    def setUp(self):
+        """Set up a logger that intercepts standard logging into a record list."""
+        root = logging.getLogger()
+        self.addCleanup(setattr, root, "handlers", root.handlers[:])
+        self.addCleanup(root.setLevel, root.level)
+
+        UnifiedLogger(LoggerConfig(log_level="CRITICAL", use_rich_console=False))
+        self.addCleanup(logger.remove)
+        self.records = []
+        logger.add(lambda message: self.records.append(message.record), level=0)
+        self.std_logger = logging.getLogger("test_logging.intercept")
+
+    def assert_from_here(self, record, line: int):
+        """Assert that a record names the calling test method and line."""
+        self.assertEqual(record["function"], self._testMethodName)
+        self.assertEqual(record["line"], line)
+        self.assertEqual(record["file"].path, __file__)
+
+    def test_caller_attribution(self):
+        """Test that records name the real caller, also on cached call sites."""
+        lines = []
+        for _ in range(2):
+            lines.append(sys._getframe().f_lineno + 1)
+            self.std_logger.warning("value %s", 42)
+
+        for record, line in zip(self.records, lines, strict=True):
+            self.assertEqual(record["level"].name, "WARNING")
+            self.assertEqual(record["message"], "value 42")
+            self.assert_from_here(record, line)
+
+    def test_exception(self):
+        """Test that logging.exception keeps the caller and the exception."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            line = sys._getframe().f_lineno + 1
+            self.std_logger.exception("failed")
+
+        (record,) = self.records
+        self.assertEqual(record["level"].name, "ERROR")
+        self.assertIs(record["exception"].type, ValueError)
+        self.assert_from_here(record, line)
+
+    def test_logger_adapter(self):
+        """Test that records from a LoggerAdapter name the adapter's caller."""
+        adapter = logging.LoggerAdapter(self.std_logger, {})
+        line = sys._getframe().f_lineno + 1
+        adapter.info("through adapter")
+
+        (record,) = self.records
+        self.assertEqual(record["message"], "through adapter")
+        self.assert_from_here(record, line)
+
+    def test_custom_level(self):
+        """Test that records at custom levels pass through with their number."""
+        self.std_logger.log(25, "between info and warning")
+
+        (record,) = self.records
+        self.assertEqual(record["level"].no, 25)
+        self.assertEqual(record["message"], "between info and warning")
+
+
+class TestShouldColorize(unittest.TestCase):
+    """Test cases for the console color decision."""
+
+    def test_plain_stream(self):
+        """Test that a stream that is not a terminal gets no colors."""
+        with patch.dict(os.environ, clear=True):
+            self.assertFalse(_should_colorize(io.StringIO()))
+
+    def test_ansi_consoles(self):
+        """Test that PyCharm and CI consoles get colors without a terminal."""
+        for env in ({"PYCHARM_HOSTED": "1"}, {"CI": "true", "GITHUB_ACTIONS": "true"}):
+            with patch.dict(os.environ, env, clear=True):
+                self.assertTrue(_should_colorize(io.StringIO()))
+
+
+class SlowStream(io.StringIO):
+    """In-memory stream that takes a while for every write."""
+
+    def __init__(self, delay: float = 0.005):
+        super().__init__()
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        time.sleep(self.delay)
+        return super().write(text)
+
+
+class GatedStream(io.StringIO):
+    """In-memory stream whose writes wait until the test opens the gate."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.entered.set()
+        self.gate.wait(5)
+        return super().write(text)
+
+
+class TestQueuedSink(unittest.TestCase):
+    """Test cases for the background console sink."""
+
+    def make_sink(self, **kwargs) -> QueuedSink:
+        """Create a sink over a slow stream, stopped again after the test."""
+        self.stream = SlowStream()
+        sink = QueuedSink(self.stream, **kwargs)
+        self.addCleanup(sink.stop)
+        return sink
+
+    def test_wait_written(self):
+        """Test that wait_written returns once earlier records are written."""
+        sink = self.make_sink()
+        for i in range(5):
+            sink.write(f"{i}\n")
+
+        self.assertTrue(sink.wait_written(timeout=5))
+        self.assertEqual(self.stream.getvalue(), "0\n1\n2\n3\n4\n")
+
+    def test_stop_drains_buffer(self):
+        """Test that stop writes every buffered record before returning."""
+        sink = QueuedSink(SlowStream(delay=0.001), batch_size=8)
+        lines = [f"{i}\n" for i in range(200)]
+        for line in lines:
+            sink.write(line)
+
+        sink.stop()
+        self.assertEqual(sink._stream.getvalue(), "".join(lines))
+        self.assertFalse(sink._thread.is_alive())
+
+    def fill_stalled_sink(self, overflow_policy: str) -> QueuedSink:
+        """
+        Create a sink holding two records while its writer is stuck in a write.
+
+        Args:
+            overflow_policy: Overflow policy of the sink.
+
+        Returns:
+            The sink, whose stream is gated until self.stream.gate is set.
+        """
+        self.stream = GatedStream()
+        sink = QueuedSink(self.stream, max_size=2, overflow_policy=overflow_policy)
+        self.addCleanup(sink.stop)
+        self.addCleanup(self.stream.gate.set)
+        sink.write("first\n")
+        self.assertTrue(self.stream.entered.wait(5))
+        sink.write("a\n")
+        sink.write("b\n")
+        return sink
+
+    def test_drop_new(self):
+        """Test that drop_new discards the record that does not fit."""
+        sink = self.fill_stalled_sink("drop_new")
+        sink.write("c\n")
+
+        self.stream.gate.set()
+        sink.stop()
+        self.assertEqual(
+            self.stream.getvalue(),
+            "first\na\nb\n[logging] dropped 1 log records\n",
+        )
+
+    def test_drop_oldest(self):
+        """Test that drop_oldest discards the oldest buffered record."""
+        sink = self.fill_stalled_sink("drop_oldest")
+        sink.write("c\n")
+        sink.write("d\n")
+
+        self.stream.gate.set()
+        sink.stop()
+        self.assertEqual(
+            self.stream.getvalue(),
+            "first\nc\nd\n[logging] dropped 2 log records\n",
+        )
+
+    def test_block(self):
+        """Test that block makes the caller wait for space and drops nothing."""
+        sink = self.fill_stalled_sink("block")
+        producer = threading.Thread(target=sink.write, args=("c\n",))
+        producer.start()
+        producer.join(0.2)
+        self.assertTrue(producer.is_alive())
+
+        self.stream.gate.set()
+        producer.join(5)
+        self.assertFalse(producer.is_alive())
+        sink.stop()
+        self.assertEqual(self.stream.getvalue(), "first\na\nb\nc\n")
+
+    def test_dropped_report_interval(self):
+        """Test that dropped records are reported once the interval passes."""
+        self.stream = GatedStream()
+        self.stream.gate.set()
+        sink = QueuedSink(
+            self.stream, max_size=0, overflow_policy="drop_new", report_interval=0
+        )
+        self.addCleanup(sink.stop)
+        sink.write("lost\n")
+        sink.write("lost\n")
+
+        self.assertTrue(sink.wait_written(timeout=5))
+        self.assertEqual(self.stream.getvalue(), "[logging] dropped 2 log records\n")
+
+
+class TestJsonRecordSink(unittest.TestCase):
+    """Test cases for the JSON console sink."""
+
+    def test_exception_includes_traceback(self):
+        """Test that logged exceptions keep their formatted traceback."""
+        stream = io.StringIO()
+        sink_id = logger.add(JsonRecordSink(stream), format="{message}")
+        self.addCleanup(logger.remove, sink_id)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+
+        data = json.loads(stream.getvalue())
+        self.assertEqual(data["message"], "failed")
+        self.assertEqual(data["exception"]["type"], "ValueError")
+        self.assertEqual(data["exception"]["value"], "boom")
+        self.assertIn(
+            "Traceback (most recent call last)", data["exception"]["traceback"]
+        )
+        self.assertIn('raise ValueError("boom")', data["exception"]["traceback"])
+
+
+if __name__ == "__main__":
+    unittest.main()